@@ -4,6 +4,8 @@ This script builds the graph, runs Edmonds-Karp with verbose step-by-step
 output, and prints a concise report plus a CSV-friendly table of flows on each
 original edge.
 """
+from collections import defaultdict
+
 from edmonds_karp import build_logistics_graph, edmonds_karp, min_cut_from_residual
 
 
@@ -23,18 +25,21 @@ if __name__ == '__main__':
     augmented_nodes = nodes + [SRC, SNK]
 
     aug_edges = edges.copy()
-    aug_edges += [(SRC, 'T1', 25 + 20 + 15), (SRC, 'T2', 15 + 30 + 10)]
-    for i in range(1, 15):
-        incoming = sum(c for (u, v, c) in edges if v == f"S{i}")
-        aug_edges.append((f"S{i}", SNK, incoming))
+    incoming = defaultdict(int)
+    outgoing = defaultdict(int)
+    for u, v, c in edges:
+        incoming[v] += c
+        outgoing[u] += c
+    aug_edges += [(SRC, 'T1', outgoing['T1']), (SRC, 'T2', outgoing['T2'])]
+    aug_edges += [(f"S{i}", SNK, incoming[f"S{i}"]) for i in range(1, 15)]
 
     print("Running Edmonds-Karp on the logistics network (verbose steps)\n")
-    maxf, flow, history = edmonds_karp(augmented_nodes, aug_edges, SRC, SNK, verbose=True)
+    maxf, flow, history = edmonds_karp(augmented_nodes, aug_edges, SRC, SNK, verbose=True, keep_history=True)
     print('\n' + '='*60)
     print(f"RESULT: maximum flow from terminals to shops = {maxf} units")
 
 
-    residual = history[-1]['residual_snapshot']
+    residual = history[-1]['final_residual']
     S, T, cut_edges, cut_cap = min_cut_from_residual(augmented_nodes, aug_edges, SRC, residual)
     print(f"Min-cut capacity = {cut_cap} (should equal max flow)")
     print(f"S-side (reachable from SRC): {sorted(list(S))}")
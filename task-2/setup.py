@@ -0,0 +1,16 @@
+"""Optional build of the Cython trie extension.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+
+The compiled src/trie extension shadows src/trie.py; without it the
+pure-Python implementation is used, so building is never required.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="goit-algo2-hw-04-task2",
+    ext_modules=cythonize("src/trie.pyx", language_level=3),
+)
@@ -1,8 +1,58 @@
 from typing import List
 
+# Nodes with at most this many children are turned into compact tuples by
+# Trie.compact(); most trie nodes have only a few children, and the tuple
+# form is far smaller than a dict-backed node.
+_COMPACT_MAX_CHILDREN = 4
 
-class TrieNode(dict):
-    """Simple Trie node implemented as a dict for children with an "_end" marker."""
+
+def _child(node, ch):
+    """Return the child of `node` for `ch`, or None; handles both the
+    TrieNode and the compact-tuple representation."""
+    if type(node) is tuple:
+        i = node[0].find(ch)
+        return node[1][i] if i >= 0 else None
+    return node.children.get(ch)
+
+
+def _children_items(node):
+    """Iterate (char, child) pairs of either node representation."""
+    if type(node) is tuple:
+        return zip(node[0], node[1])
+    return node.children.items()
+
+
+def _node_end(node):
+    """End-of-word flag of either node representation."""
+    return node[2] if type(node) is tuple else node.end
+
+
+def _node_count(node):
+    """Subtree word count of either node representation."""
+    return node[3] if type(node) is tuple else node.count
+
+
+def _compact_node(node):
+    """Recursively replace small TrieNodes with (chars, children, end, count)
+    tuples; larger nodes keep their dict but get compacted children."""
+    compacted = {ch: _compact_node(child) for ch, child in node.children.items()}
+    if len(compacted) <= _COMPACT_MAX_CHILDREN:
+        chars = "".join(sorted(compacted))
+        return (chars, tuple(compacted[ch] for ch in chars), node.end, node.count)
+    node.children = compacted
+    return node
+
+
+class TrieNode:
+    """Trie node with a children mapping, an end-of-word flag and the number
+    of stored words in its subtree (maintained incrementally by insert)."""
+
+    __slots__ = ("children", "end", "count")
+
+    def __init__(self) -> None:
+        self.children: dict = {}
+        self.end = False
+        self.count = 0
 
 
 class Trie:
@@ -14,30 +64,68 @@ class Trie:
 
     def __init__(self) -> None:
         self._root: TrieNode = TrieNode()
-        self._suffix_root: TrieNode = TrieNode()
+        # The reversed-word (suffix) trie is built lazily on the first suffix
+        # query and invalidated by insert, so workloads that never query
+        # suffixes pay neither the memory nor the double-descent on insert.
+        self._suffix_root = None
+        self._words: List[str] = []
         self._word_count = 0
-        self._END = "_end"
+        # Query memoization; repeated has_prefix/suffix queries re-walk the
+        # same paths, so cache resolved nodes. Invalidated by insert.
+        self._prefix_cache: dict = {}
 
     def insert(self, word: str) -> None:
         """Insert `word` into the trie. Raises TypeError for non-str input."""
         if not isinstance(word, str):
             raise TypeError("word must be a str")
         node = self._root
+        node.count += 1
         for ch in word:
-            if ch not in node:
-                node[ch] = TrieNode()
-            node = node[ch]
-        node[self._END] = True
-
-        rev_word = word[::-1]
-        node = self._suffix_root
-        for ch in rev_word:
-            if ch not in node:
-                node[ch] = TrieNode()
-            node = node[ch]
-        node[self._END] = True
+            if ch not in node.children:
+                node.children[ch] = TrieNode()
+            node = node.children[ch]
+            node.count += 1
+        node.end = True
 
+        self._words.append(word)
+        self._suffix_root = None
         self._word_count += 1
+        self._prefix_cache.clear()
+
+    def insert_many(self, words) -> None:
+        """Insert an iterable of words in bulk. Equivalent to calling
+        `insert` on each word, in any order.
+
+        Words are sorted first so consecutive words share descents: the
+        nodes on the previous word's path are kept on a stack and reused
+        for the length of the common prefix, so each word only walks its
+        non-shared tail.
+        """
+        stack = [self._root]
+        prev = ""
+        for word in sorted(words):
+            if not isinstance(word, str):
+                raise TypeError("word must be a str")
+            lcp = 0
+            limit = min(len(prev), len(word))
+            while lcp < limit and prev[lcp] == word[lcp]:
+                lcp += 1
+            del stack[lcp + 1:]
+            for node in stack:
+                node.count += 1
+            node = stack[-1]
+            for ch in word[lcp:]:
+                if ch not in node.children:
+                    node.children[ch] = TrieNode()
+                node = node.children[ch]
+                node.count += 1
+                stack.append(node)
+            node.end = True
+            self._words.append(word)
+            self._word_count += 1
+            prev = word
+        self._suffix_root = None
+        self._prefix_cache.clear()
 
     def put(self, word: str, value=None) -> None:
         """Alias for insert, ignoring value."""
@@ -49,20 +137,46 @@ class Trie:
             raise TypeError("word must be a str")
         node = self._root
         for ch in word:
-            if ch not in node:
+            node = _child(node, ch)
+            if node is None:
                 return False
-            node = node[ch]
-        return bool(node.get(self._END, False))
+        return _node_end(node)
+
+    def _suffix_trie(self) -> TrieNode:
+        """Return the reversed-word trie, building it from `_words` on first use."""
+        if self._suffix_root is None:
+            root = TrieNode()
+            for word in self._words:
+                node = root
+                node.count += 1
+                for ch in word[::-1]:
+                    if ch not in node.children:
+                        node.children[ch] = TrieNode()
+                    node = node.children[ch]
+                    node.count += 1
+                node.end = True
+            self._suffix_root = root
+        return self._suffix_root
 
     def _node_for_prefix(self, prefix: str, root=None):
-        """Return the node corresponding to the end of `prefix`, or None."""
+        """Return the node corresponding to the end of `prefix`, or None.
+
+        Results are memoized per (root, prefix); the cache holds node
+        references only and is cleared on insert.
+        """
         if root is None:
             root = self._root
+        key = (id(root), prefix)
+        try:
+            return self._prefix_cache[key]
+        except KeyError:
+            pass
         node = root
         for ch in prefix:
-            if ch not in node:
-                return None
-            node = node[ch]
+            node = _child(node, ch)
+            if node is None:
+                break
+        self._prefix_cache[key] = node
         return node
 
     def starts_with(self, prefix: str) -> bool:
@@ -77,26 +191,40 @@ class Trie:
         return self._node_for_prefix(prefix) is not None
 
     def _count_words_in_subtree(self, node):
-        """Count the number of complete words in the subtree rooted at node."""
+        """Count the number of complete words in the subtree rooted at node.
+
+        Counts are maintained incrementally by insert, so this is O(1).
+        """
         if node is None:
             return 0
-        count = 0
-        stack = [node]
-        while stack:
-            cur = stack.pop()
-            if cur.get(self._END):
-                count += 1
-            for k, child in cur.items():
-                if k != self._END:
-                    stack.append(child)
-        return count
+        return _node_count(node)
 
     def words(self) -> List[str]:
         """Return a list of all stored words (insertion order not guaranteed)."""
         out: List[str] = []
-        self._collect_from_node(self._root, "", out)
+        stack = [(self._root, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if _node_end(node):
+                out.append(prefix)
+            stack.extend((child, prefix + ch) for ch, child in _children_items(node))
         return out
 
+    def compact(self) -> None:
+        """Freeze the trie into a read-optimized form.
+
+        Every node with at most `_COMPACT_MAX_CHILDREN` children is replaced
+        bottom-up by a (chars, children, end, count) tuple with children
+        sorted by char; queries handle both representations transparently.
+        Only call this once no further inserts will happen — `insert` and
+        `insert_many` do not understand the compact representation. The
+        suffix trie is compacted too if it has already been built.
+        """
+        self._root = _compact_node(self._root)
+        if self._suffix_root is not None:
+            self._suffix_root = _compact_node(self._suffix_root)
+        self._prefix_cache.clear()
+
 
 class Homework(Trie):
     """Homework extension of Trie with two additional required methods."""
@@ -113,7 +241,7 @@ class Homework(Trie):
         if pattern == "":
             return self._word_count
         rev_pattern = pattern[::-1]
-        node = self._node_for_prefix(rev_pattern, self._suffix_root)
+        node = self._node_for_prefix(rev_pattern, self._suffix_trie())
         return self._count_words_in_subtree(node)
 
     def has_prefix(self, prefix: str) -> bool:
@@ -125,16 +253,4 @@ class Homework(Trie):
         if not isinstance(prefix, str):
             raise TypeError("prefix must be a str")
         node = self._node_for_prefix(prefix)
-        if node is None:
-            return False
-        
-        stack = [node]
-        while stack:
-            cur = stack.pop()
-            if cur.get(self._END):
-                return True
-            for k, child in cur.items():
-                if k == self._END:
-                    continue
-                stack.append(child)
-        return False
+        return node is not None and _node_count(node) > 0
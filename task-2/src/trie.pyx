@@ -0,0 +1,230 @@
+# cython: language_level=3
+"""Cython port of the trie (see trie.py for the reference implementation).
+
+Nodes are cdef classes, so per-character descent compiles to direct
+PyDict_GetItem calls and C attribute access instead of interpreted
+bytecode. Build in place with:
+
+    python setup.py build_ext --inplace
+
+The compiled `trie` extension then shadows trie.py on import; when it is
+absent the pure-Python module is used unchanged. Behavior must stay
+identical to trie.py — keep the two files in sync. Exception: the
+read-optimized compact() representation exists only in the pure-Python
+module; the cdef node layout is already compact.
+"""
+from typing import List
+
+
+cdef class TrieNode:
+    """Trie node with a children mapping, an end-of-word flag and the number
+    of stored words in its subtree (maintained incrementally by insert)."""
+
+    cdef public dict children
+    cdef public bint end
+    cdef public int count
+
+    def __cinit__(self):
+        self.children = {}
+        self.end = False
+        self.count = 0
+
+
+cdef class Trie:
+    """A minimal prefix-trie implementation.
+
+    - Supports insertion and membership checks.
+    - Stores words added via `insert` and allows collecting all stored words.
+    """
+
+    cdef public TrieNode _root
+    cdef public object _suffix_root
+    cdef public list _words
+    cdef public int _word_count
+    cdef public dict _prefix_cache
+
+    def __cinit__(self):
+        self._root = TrieNode()
+        # Lazily built reversed-word trie, invalidated by insert (see trie.py).
+        self._suffix_root = None
+        self._words = []
+        self._word_count = 0
+        self._prefix_cache = {}
+
+    cpdef insert(self, word):
+        """Insert `word` into the trie. Raises TypeError for non-str input."""
+        if not isinstance(word, str):
+            raise TypeError("word must be a str")
+        cdef TrieNode node = self._root
+        node.count += 1
+        for ch in <str>word:
+            if ch not in node.children:
+                node.children[ch] = TrieNode()
+            node = node.children[ch]
+            node.count += 1
+        node.end = True
+
+        self._words.append(word)
+        self._suffix_root = None
+        self._word_count += 1
+        self._prefix_cache.clear()
+
+    def insert_many(self, words):
+        """Insert an iterable of words in bulk. Equivalent to calling
+        `insert` on each word, in any order.
+
+        Words are sorted first so consecutive words share descents: the
+        nodes on the previous word's path are kept on a stack and reused
+        for the length of the common prefix, so each word only walks its
+        non-shared tail.
+        """
+        cdef list stack = [self._root]
+        cdef TrieNode node
+        cdef str prev = ""
+        cdef Py_ssize_t lcp, limit
+        for word in sorted(words):
+            if not isinstance(word, str):
+                raise TypeError("word must be a str")
+            lcp = 0
+            limit = min(len(prev), len(<str>word))
+            while lcp < limit and prev[lcp] == (<str>word)[lcp]:
+                lcp += 1
+            del stack[lcp + 1:]
+            for node in stack:
+                node.count += 1
+            node = stack[-1]
+            for ch in (<str>word)[lcp:]:
+                if ch not in node.children:
+                    node.children[ch] = TrieNode()
+                node = node.children[ch]
+                node.count += 1
+                stack.append(node)
+            node.end = True
+            self._words.append(word)
+            self._word_count += 1
+            prev = word
+        self._suffix_root = None
+        self._prefix_cache.clear()
+
+    def put(self, word, value=None):
+        """Alias for insert, ignoring value."""
+        self.insert(word)
+
+    cpdef bint contains(self, word) except *:
+        """Return True if `word` is present exactly in the trie."""
+        if not isinstance(word, str):
+            raise TypeError("word must be a str")
+        cdef TrieNode node = self._root
+        for ch in <str>word:
+            if ch not in node.children:
+                return False
+            node = node.children[ch]
+        return node.end
+
+    cdef TrieNode _suffix_trie(self):
+        """Return the reversed-word trie, building it from `_words` on first use."""
+        cdef TrieNode root, node
+        if self._suffix_root is None:
+            root = TrieNode()
+            for word in self._words:
+                node = root
+                node.count += 1
+                for ch in <str>word[::-1]:
+                    if ch not in node.children:
+                        node.children[ch] = TrieNode()
+                    node = node.children[ch]
+                    node.count += 1
+                node.end = True
+            self._suffix_root = root
+        return <TrieNode>self._suffix_root
+
+    def _node_for_prefix(self, prefix, root=None):
+        """Return the node corresponding to the end of `prefix`, or None.
+
+        Results are memoized per (root, prefix); the cache holds node
+        references only and is cleared on insert.
+        """
+        if root is None:
+            root = self._root
+        key = (id(root), prefix)
+        try:
+            return self._prefix_cache[key]
+        except KeyError:
+            pass
+        cdef TrieNode node = <TrieNode>root
+        for ch in <str>prefix:
+            if ch not in node.children:
+                node = None
+                break
+            node = node.children[ch]
+        self._prefix_cache[key] = node
+        return node
+
+    def starts_with(self, prefix):
+        """Return True if the trie contains the path for `prefix` (may not be a complete word).
+
+        Note: this method only checks whether the prefix path exists; it does NOT
+        guarantee there is a stored word that has the prefix (use Homework.has_prefix
+        for that semantic).
+        """
+        if not isinstance(prefix, str):
+            raise TypeError("prefix must be a str")
+        return self._node_for_prefix(prefix) is not None
+
+    def _count_words_in_subtree(self, node):
+        """Count the number of complete words in the subtree rooted at node.
+
+        Counts are maintained incrementally by insert, so this is O(1).
+        """
+        if node is None:
+            return 0
+        return (<TrieNode>node).count
+
+    def compact(self):
+        """No-op for API parity with trie.py: cdef nodes already use a fixed
+        compact layout, so there is nothing to freeze."""
+
+    def words(self):
+        """Return a list of all stored words (insertion order not guaranteed)."""
+        cdef list out = []
+        cdef list stack = [(self._root, "")]
+        cdef TrieNode node
+        while stack:
+            node, prefix = stack.pop()
+            if node.end:
+                out.append(prefix)
+            for ch, child in node.children.items():
+                stack.append((child, prefix + ch))
+        return out
+
+
+cdef class Homework(Trie):
+    """Homework extension of Trie with two additional required methods."""
+
+    cpdef int count_words_with_suffix(self, pattern) except *:
+        """Count stored words that end with `pattern`.
+
+        - `pattern` must be a str, otherwise raises TypeError.
+        - An empty `pattern` matches all stored words (by convention).
+        - Returns an int (0 or positive).
+        """
+        if not isinstance(pattern, str):
+            raise TypeError("pattern must be a str")
+        if pattern == "":
+            return self._word_count
+        rev_pattern = (<str>pattern)[::-1]
+        node = self._node_for_prefix(rev_pattern, self._suffix_trie())
+        if node is None:
+            return 0
+        return (<TrieNode>node).count
+
+    cpdef bint has_prefix(self, prefix) except *:
+        """Return True iff there exists at least one stored word that starts with `prefix`.
+
+        - `prefix` must be a str, otherwise raises TypeError.
+        - An empty `prefix` returns True iff the trie contains at least one word.
+        """
+        if not isinstance(prefix, str):
+            raise TypeError("prefix must be a str")
+        node = self._node_for_prefix(prefix)
+        return node is not None and (<TrieNode>node).count > 0
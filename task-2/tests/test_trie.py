@@ -35,6 +35,44 @@ def test_input_validation():
         t.has_prefix(123)  # type: ignore
 
 
+def test_repeated_queries_and_cache_invalidation():
+    t = make_trie_with_words()
+    # repeated queries hit the memoized path and must stay consistent
+    assert t.count_words_with_suffix("t") == t.count_words_with_suffix("t") == 2
+    assert t.has_prefix("do") is True
+    # insert invalidates cached nodes/counts
+    t.insert("dot")
+    assert t.count_words_with_suffix("t") == 3
+    assert t.has_prefix("do") is True
+
+
+def test_insert_many_matches_repeated_insert():
+    words = ["application", "app", "apple", "cat", "cater", "app"]
+    bulk = Homework()
+    bulk.insert_many(words)
+    one_by_one = Homework()
+    for w in words:
+        one_by_one.insert(w)
+    assert sorted(bulk.words()) == sorted(one_by_one.words())
+    for p in ("", "app", "appl", "cat", "z"):
+        assert bulk.has_prefix(p) == one_by_one.has_prefix(p)
+    for s in ("", "p", "er", "t", "q"):
+        assert bulk.count_words_with_suffix(s) == one_by_one.count_words_with_suffix(s)
+
+
+def test_compact_preserves_queries():
+    t = make_trie_with_words()
+    words_before = sorted(t.words())
+    t.compact()
+    assert sorted(t.words()) == words_before
+    assert t.contains("app") is True
+    assert t.contains("ap") is False
+    assert t.has_prefix("ap") is True
+    assert t.has_prefix("z") is False
+    assert t.count_words_with_suffix("er") == 1
+    assert t.count_words_with_suffix("") == 7
+
+
 def test_interaction_with_base_trie_methods():
     t = make_trie_with_words()
     assert t.contains("app") is True